@@ -0,0 +1,56 @@
+# Only the public API is used, so the script can be run unchanged against any revision to compare results.
+import gc
+import tracemalloc
+from typing import Callable, List, Type
+
+from pytainer import Container
+
+REGISTRATIONS = 20_000
+
+
+class Dependency:
+    pass
+
+
+def generate_service(name: str, dependency: type) -> Type[object]:
+    def __init__(self, dependency: dependency) -> None:  # type: ignore
+        self.dependency = dependency
+
+    return type(name, (), {"__init__": __init__})
+
+
+def generate_shared(count: int) -> List[Type[object]]:
+    # Every service depends on the same type, the best case for sharing dependency tuples.
+    return [generate_service(f"Service{i}", Dependency) for i in range(count)]
+
+
+def generate_distinct(count: int) -> List[Type[object]]:
+    # Every service depends on the previously generated one, so no two signatures are alike.
+    services: List[Type[object]] = []
+    for i in range(count):
+        services.append(generate_service(f"Service{i}", services[-1] if services else Dependency))
+    return services
+
+
+def measure(services: List[Type[object]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    container = Container()
+    container.register_instance(Dependency, Dependency())
+    for service in services:
+        container.register_implementation(service, service)
+    container.verify()
+
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / len(services)
+
+
+if __name__ == "__main__":
+    cases: List[Callable[[int], List[Type[object]]]] = [generate_shared, generate_distinct]
+    for generate in cases:
+        services = generate(REGISTRATIONS)
+        print(f"{generate.__name__}: {REGISTRATIONS} registrations, {measure(services):.1f} bytes per registration")
@@ -1,6 +1,7 @@
 from .container import Container
+from .disposal import Disposal
 from .exceptions import RegistrationException, ResolutionException
 from .interfaces import IContainer
 from .lifecycle import Lifecycle
 
-__all__ = ["Container", "RegistrationException", "ResolutionException", "IContainer", "Lifecycle"]
+__all__ = ["Container", "Disposal", "RegistrationException", "ResolutionException", "IContainer", "Lifecycle"]
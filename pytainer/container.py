@@ -1,10 +1,20 @@
-from typing import Callable, List, Optional, Type, TypeVar
+import asyncio
+import copy
+import os
+from contextlib import contextmanager
+from queue import Empty, Queue
+from threading import Thread
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type, TypeVar, get_origin
 
-from pytainer.exceptions import RegistrationException, ResolutionException, VerificationException
-from pytainer.interfaces import DependencyFactory, IContainer, Provider
+from pytainer.disposal import Disposal
+from pytainer.exceptions import RegistrationException, ResolutionException
+from pytainer.interfaces import DependencyFactory, IContainer, Parameter, Provider
 from pytainer.lifecycle import Lifecycle
-from pytainer.providers import FactoryProvider, ImplementationProvider, InstanceProvider
+from pytainer.providers import FactoryProvider, ImplementationProvider, InstanceProvider, OpenGenericProvider
 from pytainer.registry import Registry
+from pytainer.utilities import dispose_instance, dispose_instance_async, extract_constructor, is_disposable
 
 _T = TypeVar("_T")
 
@@ -13,7 +23,15 @@ class Container(IContainer):
     def __init__(self) -> None:
         super().__init__()
         self._registry: Registry = Registry()
-        self._verification_cbs: List[Callable[[IContainer], Optional[VerificationException]]] = []
+        self._open_generics: Dict[type, OpenGenericProvider[Any]] = {}
+        self._dependents: Dict[type, Sequence[Provider[Any]]] = {}
+        self._aggregates: Dict[type, Tuple[Any, ...]] = {}
+        self._retired: Dict[Provider[Any], Sequence[Provider[Any]]] = {}
+        self._providers: List[Provider[Any]] = []
+        # Only needed while registering, the table is emptied once verified and every extension starts its own.
+        self._constructors: Dict[Tuple[Parameter[Any], ...], Tuple[Parameter[Any], ...]] = {}
+        self._parent: Optional[Container] = None
+        self._extension: Optional[Container] = None
 
     # ! ======================= Registration Methods ======================= ! #
     def register_factory(self, service: Type[_T], factory: DependencyFactory[_T]) -> None:
@@ -25,39 +43,360 @@ class Container(IContainer):
         return self._register(service, provider)
 
     def register_implementation(self, service: Type[_T], implementation: Type[_T], lifecycle: Lifecycle = Lifecycle.Singleton) -> None:
-        provider = ImplementationProvider(service, implementation, lifecycle)
+        if self._extension is not None:
+            return self._extension.register_implementation(service, implementation, lifecycle)
+
+        dependencies = extract_constructor(implementation.__init__, self._constructors)
+        provider = ImplementationProvider(service, implementation, lifecycle, dependencies)
         return self._register(service, provider)
 
+    def register_open_generic(self, service: type, implementation: type, lifecycle: Lifecycle = Lifecycle.Singleton) -> None:
+        if self._extension is not None:
+            return self._extension.register_open_generic(service, implementation, lifecycle)
+
+        self.__verify_registration(service)
+        dependencies = extract_constructor(implementation.__init__, self._constructors)
+        provider: OpenGenericProvider[Any] = OpenGenericProvider(service, implementation, lifecycle, dependencies)
+        self._providers.append(provider)
+        self._open_generics[service] = provider
+
+    @contextmanager
+    def extend(self) -> Iterator["Container"]:
+        if not self.verified:
+            yield self
+            return
+
+        if self._extension is not None:
+            raise RegistrationException(type(self), "Cannot extend a container while another extension is in progress.")
+
+        # Registrations are staged in a child container that falls back to this one, so resolution keeps working meanwhile.
+        extension = Container()
+        extension._parent = self
+        self._extension = extension
+
+        try:
+            yield extension
+            for provider in extension._providers:
+                if exception := provider.verify(extension):
+                    raise exception
+            self.__publish(extension)
+        finally:
+            self._extension = None
+
     # ! ======================= Resolution Methods ======================= ! #
     def resolve(self, service: Type[_T]) -> _T:
         self.__verify_resolvancy(service)
+        if self._parent is not None and not self.__owns(service):
+            return self._parent.resolve(service)
+
         if provider := self._registry.get(service):
             return provider.resolve(self)
 
+        if provider := self.__close_open_generic(service):
+            return provider.resolve(self)
+
         raise ResolutionException(service, "Attempted to resolve unregistered type.")
 
-    def resolve_all(self, service: Type[_T]) -> List[_T]:
+    def resolve_all(self, service: Type[_T]) -> Sequence[_T]:
         self.__verify_resolvancy(service)
-        if providers := self._registry.get_all(service):
-            return [provider.resolve(self) for provider in providers]
+        if self._parent is not None and not self.__owns(service):
+            return self._parent.resolve_all(service)
 
-        raise ResolutionException(service, "Attempted to resolve unregistered type.")
+        if (aggregate := self._aggregates.get(service)) is not None:
+            return aggregate
+
+        providers = self.__get_providers(service)
+        instances = [provider.resolve(self) for provider in providers]
+        if all(provider.lifecycle is Lifecycle.Singleton for provider in providers):
+            aggregate = self._aggregates[service] = tuple(instances)
+            return aggregate
+        return instances
+
+    def iter_all(self, service: Type[_T]) -> Iterator[_T]:
+        self.__verify_resolvancy(service)
+        if self._parent is not None and not self.__owns(service):
+            return self._parent.iter_all(service)
+
+        return (provider.resolve(self) for provider in self.__get_providers(service))
 
     # ! ======================= Verification Methods ======================= ! #
     def is_registered(self, service: type) -> bool:
-        return bool(self._registry.get(service))
+        return self.__owns(service) or (self._parent is not None and self._parent.is_registered(service))
 
     def verify(self) -> None:
-        for callback in self._verification_cbs:
-            if exception := callback(self):
+        for provider in self._providers:
+            if exception := provider.verify(self):
                 raise exception
+        self._registry.freeze()
+        self.__freeze_dependents()
+        self._constructors.clear()
         self.verified = True
 
+    # ! ======================= Disposal Methods ======================= ! #
+    def dispose(self, timeout: Optional[float] = None, max_workers: Optional[int] = None) -> List[Disposal]:
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        waves, dependencies = self.__disposal_waves(asynchronous=False)
+        blocked: Set[Provider[Any]] = set()
+        disposals: List[Disposal] = []
+        for wave in waves:
+            results = self.__dispose_wave([provider for provider in wave if provider not in blocked], timeout, workers)
+            disposals.extend(self.__record_wave(wave, results, blocked, dependencies))
+
+        self._aggregates.clear()
+        return disposals
+
+    async def dispose_async(self, timeout: Optional[float] = None) -> List[Disposal]:
+        waves, dependencies = self.__disposal_waves(asynchronous=True)
+        blocked: Set[Provider[Any]] = set()
+        disposals: List[Disposal] = []
+        for wave in waves:
+            runnable = [provider for provider in wave if provider not in blocked]
+            results = await asyncio.gather(*(self.__dispose_async(provider.service, provider.release(), timeout) for provider in runnable))
+            disposals.extend(self.__record_wave(wave, dict(zip(runnable, results)), blocked, dependencies))
+
+        self._aggregates.clear()
+        return disposals
+
+    def __enter__(self) -> "Container":
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc: Optional[BaseException], traceback: Optional[TracebackType]) -> None:
+        self.dispose()
+
+    async def __aenter__(self) -> "Container":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.dispose_async()
+
     # ! ======================= Private Helper Methods ======================= ! #
     def _register(self, service: Type[_T], provider: Provider[_T]) -> None:
+        if self._extension is not None:
+            return self._extension._register(service, provider)
+
         self.__verify_registration(service)
-        self._verification_cbs.append(provider.verify)
+        self._providers.append(provider)
         self._registry.set(service, provider)
+        self.__index_dependents(provider)
+
+    def __owns(self, service: type) -> bool:
+        return bool(self._registry.get(service)) or get_origin(service) in self._open_generics
+
+    def __get_providers(self, service: Type[_T]) -> Sequence[Provider[_T]]:
+        if providers := self._registry.get_all(service):
+            return providers
+
+        if provider := self.__close_open_generic(service):
+            return (provider,)
+
+        raise ResolutionException(service, "Attempted to resolve unregistered type.")
+
+    def __close_open_generic(self, service: Type[_T]) -> Optional[Provider[_T]]:
+        if open_generic := self._open_generics.get(get_origin(service)):  # type: ignore
+            if provider := open_generic.closed.get(service):
+                return provider
+
+            provider = open_generic.close(service, self)
+            self.__index_dependents(provider)
+            return provider
+        return None
+
+    def __index_dependents(self, provider: Provider[Any]) -> None:
+        # Like the registry, the index appends to lists and is frozen into tuples once verified.
+        for dependency in provider.dependencies:
+            dependents = self._dependents.get(dependency.type)
+            if dependents is None:
+                self._dependents[dependency.type] = [provider]
+            elif isinstance(dependents, list):
+                dependents.append(provider)
+            else:
+                self._dependents[dependency.type] = [*dependents, provider]
+
+    def __freeze_dependents(self, services: Optional[Iterable[type]] = None) -> None:
+        for service in self._dependents if services is None else services:
+            if isinstance(dependents := self._dependents.get(service), list):
+                self._dependents[service] = tuple(dependents)
+
+    def __publish(self, extension: "Container") -> None:
+        changed: Set[type] = set()
+        stale: List[Provider[Any]] = []
+        for provider in extension._providers:
+            changed.add(provider.service)
+            if isinstance(provider, OpenGenericProvider) and (replaced := self._open_generics.get(provider.service)):
+                changed.update(replaced.closed)
+                stale.extend(replaced.closed.values())
+
+        visited = self.__stale_providers(changed, stale)
+        # The dependencies stale singletons were built from are captured before publishing, so they can be disposed in order.
+        retiring = {provider: self.__direct_dependencies(provider) for provider in stale if provider.instance is not None}
+
+        indexed: List[Provider[Any]] = []
+        for provider in extension._providers:
+            if isinstance(provider, OpenGenericProvider):
+                self._open_generics[provider.service] = provider
+                indexed.extend(provider.closed.values())
+            else:
+                self._registry.set(provider.service, provider)
+                indexed.append(provider)
+            self._providers.append(provider)
+
+        for provider in indexed:
+            self.__index_dependents(provider)
+        self._registry.freeze(changed)
+        self.__freeze_dependents({dependency.type for provider in indexed for dependency in provider.dependencies})
+        for service in visited:
+            self._aggregates.pop(service, None)
+        self.__retire(retiring)
+
+    def __stale_providers(self, services: Set[type], stale: List[Provider[Any]]) -> Set[type]:
+        # Singletons that were built on top of a changed service hold a stale dependency graph.
+        visited: Set[type] = set(services)
+        pending: List[type] = list(services)
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent.lifecycle is Lifecycle.Singleton:
+                    stale.append(dependent)
+                if dependent.service not in visited:
+                    visited.add(dependent.service)
+                    pending.append(dependent.service)
+        return visited
+
+    def __retire(self, retiring: Dict[Provider[Any], Sequence[Provider[Any]]]) -> None:
+        # Retired instances are kept, with the providers they were built from, until the container is disposed.
+        shells = {provider: copy.copy(provider) for provider in retiring}
+        for provider, shell in shells.items():
+            provider.instance = None
+            self._retired[shell] = tuple(shells.get(dependency, dependency) for dependency in retiring[provider])
+
+    def __disposal_waves(self, asynchronous: bool) -> Tuple[List[List[Provider[Any]]], Dict[Provider[Any], Set[Provider[Any]]]]:
+        # Singletons are disposed after every singleton that depends on them, possibly through non-disposable providers.
+        providers = [provider for provider in self._providers if not isinstance(provider, OpenGenericProvider)]
+        providers.extend(closed for open_generic in self._open_generics.values() for closed in open_generic.closed.values())
+        providers.extend(self._retired)
+        owned = [provider for provider in providers if provider.instance is not None and not isinstance(provider, InstanceProvider)]
+        nodes = {provider: index for index, provider in enumerate(owned) if is_disposable(provider.instance, asynchronous)}
+
+        dependencies: Dict[Provider[Any], Set[Provider[Any]]] = {}
+        dependents: Dict[Provider[Any], int] = dict.fromkeys(nodes, 0)
+        for provider in nodes:
+            dependencies[provider] = self.__disposable_dependencies(provider, nodes)
+            for dependency in dependencies[provider]:
+                dependents[dependency] += 1
+
+        waves: List[List[Provider[Any]]] = []
+        remaining = sorted(nodes, key=nodes.__getitem__)
+        while remaining:
+            wave = [provider for provider in remaining if dependents[provider] == 0] or remaining
+            waves.append(wave)
+            disposed = set(wave)
+            for provider in wave:
+                for dependency in dependencies[provider]:
+                    dependents[dependency] -= 1
+            remaining = [provider for provider in remaining if provider not in disposed]
+        return waves, dependencies
+
+    def __record_wave(
+        self,
+        wave: List[Provider[Any]],
+        results: Dict[Provider[Any], Disposal],
+        blocked: Set[Provider[Any]],
+        dependencies: Dict[Provider[Any], Set[Provider[Any]]],
+    ) -> List[Disposal]:
+        # A timed out disposal may still be running, so the singletons it depends on are skipped rather than disposed under it.
+        disposals: List[Disposal] = []
+        for provider in wave:
+            disposal = results[provider] if provider in results else Disposal(provider.service, 0.0, skipped=True)
+            if disposal.timed_out or disposal.skipped:
+                blocked.update(dependencies[provider])
+            if not disposal.skipped:
+                self._retired.pop(provider, None)
+            disposals.append(disposal)
+        return disposals
+
+    def __disposable_dependencies(self, provider: Provider[Any], nodes: Dict[Provider[Any], int]) -> Set[Provider[Any]]:
+        found: Set[Provider[Any]] = set()
+        visited: Set[Provider[Any]] = {provider}
+        pending: List[Provider[Any]] = [provider]
+        while pending:
+            for resolved in self.__direct_dependencies(pending.pop()):
+                if resolved in visited:
+                    continue
+                visited.add(resolved)
+                if resolved in nodes:
+                    found.add(resolved)
+                else:
+                    pending.append(resolved)
+        return found
+
+    def __direct_dependencies(self, provider: Provider[Any]) -> Sequence[Provider[Any]]:
+        if (retired := self._retired.get(provider)) is not None:
+            return retired
+
+        dependencies: List[Provider[Any]] = []
+        for dependency in provider.dependencies:
+            if resolved := self._registry.get(dependency.type) or self.__closed_generic(dependency.type):
+                dependencies.append(resolved)
+        return dependencies
+
+    def __closed_generic(self, service: type) -> Optional[Provider[Any]]:
+        if open_generic := self._open_generics.get(get_origin(service)):  # type: ignore
+            return open_generic.closed.get(service)
+        return None
+
+    def __dispose_wave(self, wave: List[Provider[Any]], timeout: Optional[float], workers: int) -> Dict[Provider[Any], Disposal]:
+        # Disposals run on at most `workers` daemon threads. A timed out disposal cannot be cancelled, so its thread is
+        # abandoned and its slot is handed to the next disposal, which keeps a hung closer from stalling the rest.
+        completed: "Queue[Tuple[Provider[Any], Disposal]]" = Queue()
+        results: Dict[Provider[Any], Disposal] = {}
+        running: Dict[Provider[Any], float] = {}
+        waiting = list(reversed(wave))
+
+        def run(provider: Provider[Any], instance: Any) -> None:
+            completed.put((provider, self.__dispose(provider.service, instance)))
+
+        while waiting or running:
+            while waiting and len(running) < workers:
+                provider = waiting.pop()
+                running[provider] = perf_counter()
+                Thread(target=run, args=(provider, provider.release()), daemon=True).start()
+
+            deadline = None if timeout is None else max(0.0, min(running.values()) + timeout - perf_counter())
+            try:
+                provider, disposal = completed.get(timeout=deadline)
+                if running.pop(provider, None) is not None:
+                    results[provider] = disposal
+            except Empty:
+                now = perf_counter()
+                for provider, start in list(running.items()):
+                    if timeout is not None and now - start >= timeout:
+                        del running[provider]
+                        results[provider] = Disposal(provider.service, now - start, timed_out=True)
+        return results
+
+    @staticmethod
+    def __dispose(service: type, instance: Any) -> Disposal:
+        start = perf_counter()
+        try:
+            dispose_instance(instance)
+        except Exception as ex:
+            return Disposal(service, perf_counter() - start, ex)
+        return Disposal(service, perf_counter() - start)
+
+    @staticmethod
+    async def __dispose_async(service: type, instance: Any, timeout: Optional[float]) -> Disposal:
+        start = perf_counter()
+        try:
+            await asyncio.wait_for(dispose_instance_async(instance), timeout)
+        except asyncio.TimeoutError:
+            return Disposal(service, perf_counter() - start, timed_out=True)
+        except Exception as ex:
+            return Disposal(service, perf_counter() - start, ex)
+        return Disposal(service, perf_counter() - start)
 
     def __verify_resolvancy(self, service: type):
         if not self.verified:
@@ -0,0 +1,30 @@
+from typing import Optional
+
+
+class Disposal:
+    __slots__ = ("service", "duration", "exception", "timed_out", "skipped")
+
+    def __init__(
+        self,
+        service: type,
+        duration: float,
+        exception: Optional[BaseException] = None,
+        timed_out: bool = False,
+        skipped: bool = False,
+    ) -> None:
+        self.service: type = service
+        self.duration: float = duration
+        self.exception: Optional[BaseException] = exception
+        self.timed_out: bool = timed_out
+        self.skipped: bool = skipped
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exception is None and not self.timed_out and not self.skipped
+
+    def __repr__(self) -> str:
+        if self.skipped or self.timed_out:
+            status = "skipped" if self.skipped else "timed out"
+        else:
+            status = f"failed: {self.exception!r}" if self.exception else "disposed"
+        return f"Disposal({self.service}, {status} in {self.duration:.6f}s)"
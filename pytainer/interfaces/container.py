@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Type, TypeVar
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Optional, Sequence, Type, TypeVar
 
 from pytainer.interfaces.dependency_factory import DependencyFactory
 from pytainer.lifecycle import Lifecycle
 
+if TYPE_CHECKING:
+    from pytainer.disposal import Disposal
+
 _T = TypeVar("_T")
 
 
@@ -23,12 +26,24 @@ class IContainer(ABC):
     def register_factory(self, service: Type[_T], factory: DependencyFactory[_T]) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def register_open_generic(self, service: type, implementation: type, lifecycle: Lifecycle = Lifecycle.Singleton) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def extend(self) -> ContextManager["IContainer"]:
+        raise NotImplementedError()
+
     @abstractmethod
     def resolve(self, service: Type[_T]) -> _T:
         raise NotImplementedError()
 
     @abstractmethod
-    def resolve_all(self, service: Type[_T]) -> List[_T]:
+    def resolve_all(self, service: Type[_T]) -> Sequence[_T]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def iter_all(self, service: Type[_T]) -> Iterator[_T]:
         raise NotImplementedError()
 
     @abstractmethod
@@ -38,3 +53,11 @@ class IContainer(ABC):
     @abstractmethod
     def verify(self) -> None:
         raise NotImplementedError()
+
+    @abstractmethod
+    def dispose(self, timeout: Optional[float] = None, max_workers: Optional[int] = None) -> List["Disposal"]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def dispose_async(self, timeout: Optional[float] = None) -> List["Disposal"]:
+        raise NotImplementedError()
@@ -4,6 +4,14 @@ _T = TypeVar("_T")
 
 
 class Parameter(Generic[_T]):
+    __slots__ = ("name", "type")
+
     def __init__(self, name: str, _type: Type[_T]) -> None:
         self.name: str = name
         self.type: Type[_T] = _type
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Parameter) and self.name == other.name and self.type == other.type
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.type))
@@ -1,18 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, Type, TypeVar
+from typing import Any, Generic, Optional, Tuple, Type, TypeVar
 
 from pytainer.exceptions import VerificationException
 from pytainer.interfaces.container import IContainer
+from pytainer.interfaces.parameter import Parameter
 from pytainer.lifecycle import Lifecycle
 
 _T = TypeVar("_T")
 
 
 class Provider(ABC, Generic[_T]):
+    __slots__ = ("service", "lifecycle", "instance", "dependencies")
+
     def __init__(self, service: Type[_T], lifecycle: Lifecycle, instance: Optional[_T] = None) -> None:
         self.service: Type[_T] = service
         self.lifecycle: Lifecycle = lifecycle
         self.instance: Optional[_T] = instance
+        self.dependencies: Tuple[Parameter[Any], ...] = ()
 
     @abstractmethod
     def verify(self, container: IContainer) -> Optional[VerificationException]:
@@ -21,3 +25,7 @@ class Provider(ABC, Generic[_T]):
     @abstractmethod
     def resolve(self, container: IContainer) -> _T:
         raise NotImplementedError()
+
+    def release(self) -> Optional[_T]:
+        instance, self.instance = self.instance, None
+        return instance
@@ -1,5 +1,6 @@
 from .factory_provider import FactoryProvider
 from .implementation_provider import ImplementationProvider
 from .instance_provider import InstanceProvider
+from .open_generic_provider import OpenGenericProvider
 
-__all__ = ["FactoryProvider", "ImplementationProvider", "InstanceProvider"]
+__all__ = ["FactoryProvider", "ImplementationProvider", "InstanceProvider", "OpenGenericProvider"]
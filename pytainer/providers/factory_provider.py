@@ -9,6 +9,8 @@ _T = TypeVar("_T")
 
 
 class FactoryProvider(Generic[_T], Provider[_T]):
+    __slots__ = ("factory",)
+
     def __init__(self, service: Type[_T], factory: DependencyFactory[_T]) -> None:
         super().__init__(service, Lifecycle.Transient)
         self.factory = factory
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar
 
 from pytainer.exceptions import ResolutionException, VerificationException
 from pytainer.interfaces import IContainer, Parameter, Provider
@@ -9,10 +9,18 @@ _T = TypeVar("_T")
 
 
 class ImplementationProvider(Generic[_T], Provider[_T]):
-    def __init__(self, service: Type[_T], implementation: Type[_T], lifecycle: Lifecycle = Lifecycle.Transient) -> None:
+    __slots__ = ("implementation",)
+
+    def __init__(
+        self,
+        service: Type[_T],
+        implementation: Type[_T],
+        lifecycle: Lifecycle = Lifecycle.Transient,
+        dependencies: Optional[Tuple[Parameter[Any], ...]] = None,
+    ) -> None:
         super().__init__(service, lifecycle)
         self.implementation = implementation
-        self.dependencies: List[Parameter[Any]] = extract_constructor(self.implementation.__init__)
+        self.dependencies = dependencies if dependencies is not None else extract_constructor(self.implementation.__init__)
 
     def __exception(self, reason: str) -> VerificationException:
         return VerificationException(self.service, reason)
@@ -8,6 +8,8 @@ _T = TypeVar("_T")
 
 
 class InstanceProvider(Generic[_T], Provider[_T]):
+    __slots__ = ()
+
     def __init__(self, service: Type[_T], instance: _T) -> None:
         super().__init__(service, Lifecycle.Singleton, instance)
 
@@ -21,3 +23,6 @@ class InstanceProvider(Generic[_T], Provider[_T]):
         if not self.instance:
             raise ResolutionException(self.service, "No instance is registered.")
         return self.instance
+
+    def release(self) -> Optional[_T]:
+        return None  # registered instances are owned by the caller
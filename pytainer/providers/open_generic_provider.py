@@ -0,0 +1,84 @@
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar, get_args, get_origin
+
+from pytainer.exceptions import ResolutionException, VerificationException
+from pytainer.interfaces import IContainer, Parameter, Provider
+from pytainer.lifecycle import Lifecycle
+from pytainer.providers.implementation_provider import ImplementationProvider
+from pytainer.utilities import extract_constructor, get_generic_bases, is_subclass, substitute_type_vars
+
+_T = TypeVar("_T")
+
+
+class OpenGenericProvider(Generic[_T], Provider[_T]):
+    __slots__ = ("implementation", "parameters", "closed")
+
+    def __init__(
+        self,
+        service: Type[_T],
+        implementation: Type[_T],
+        lifecycle: Lifecycle = Lifecycle.Singleton,
+        dependencies: Optional[Tuple[Parameter[Any], ...]] = None,
+    ) -> None:
+        super().__init__(service, lifecycle)
+        self.implementation = implementation
+        self.parameters: Tuple[Any, ...] = self.__service_parameters()
+        self.dependencies = dependencies if dependencies is not None else extract_constructor(self.implementation.__init__)
+        self.closed: Dict[type, ImplementationProvider[Any]] = {}
+
+    def __exception(self, reason: str) -> VerificationException:
+        return VerificationException(self.service, reason)
+
+    def verify(self, container: IContainer) -> Optional[VerificationException]:
+        if not is_subclass(self.implementation, self.service):
+            return self.__exception(f'Implementation "{self.implementation}" is not subclass of "{self.service}"')
+
+        service_parameters: Tuple[Any, ...] = getattr(self.service, "__parameters__", ())
+        implementation_parameters: Tuple[Any, ...] = getattr(self.implementation, "__parameters__", ())
+        if (
+            not service_parameters
+            or len(self.parameters) != len(service_parameters)
+            or not all(isinstance(parameter, TypeVar) for parameter in self.parameters)
+            or len(set(self.parameters)) != len(self.parameters)
+            or set(self.parameters) != set(implementation_parameters)
+        ):
+            reason = (
+                f'Implementation "{self.implementation}" must directly subclass "{self.service}" '
+                "parameterized with exactly its own type parameters."
+            )
+            return self.__exception(reason)
+
+        for dependency in self.dependencies:
+            if getattr(dependency.type, "__parameters__", ()) or isinstance(dependency.type, TypeVar):
+                continue  # depends on the type arguments, checked when the service is closed
+            if not container.is_registered(dependency.type):
+                return self.__exception(f"{self.implementation} depends on {dependency.type} but it's not registered.")
+        return None
+
+    def close(self, service: Type[_T], container: IContainer) -> ImplementationProvider[_T]:
+        mapping: Dict[Any, Any] = dict(zip(self.parameters, get_args(service)))
+
+        for parameter, argument in mapping.items():
+            bound = getattr(parameter, "__bound__", None)
+            if bound is not None and not is_subclass(argument, bound):
+                raise ResolutionException(service, f'Type argument "{argument}" does not satisfy the bound "{bound}" of {parameter}.')
+
+        dependencies = tuple(Parameter(dependency.name, substitute_type_vars(dependency.type, mapping)) for dependency in self.dependencies)
+        for dependency in dependencies:
+            if not container.is_registered(dependency.type):
+                raise ResolutionException(service, f"{self.implementation} depends on {dependency.type} but it's not registered.")
+
+        arguments = tuple(mapping[parameter] for parameter in self.implementation.__parameters__)  # type: ignore
+        implementation: Type[_T] = self.implementation[arguments]  # type: ignore
+        provider = ImplementationProvider(service, implementation, self.lifecycle, dependencies)
+        self.closed[service] = provider
+        return provider
+
+    def __service_parameters(self) -> Tuple[Any, ...]:
+        # The implementation's own type parameters, ordered by the position they take in the service.
+        for base in get_generic_bases(self.implementation):
+            if get_origin(base) is self.service:
+                return get_args(base)
+        return ()
+
+    def resolve(self, container: IContainer) -> _T:
+        raise ResolutionException(self.service, "Open generic services can only be resolved through a closed type.")
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 from pytainer.interfaces import Provider
 from pytainer.utilities import last_or_default
@@ -6,29 +6,34 @@ from pytainer.utilities import last_or_default
 
 class Registry:
     def __init__(self) -> None:
-        self._registry: Dict[type, List[Provider[Any]]] = {}
+        # Registrations are appended to lists and frozen into tuples once verified, which take less memory.
+        self._registry: Dict[type, Union[List[Provider[Any]], Sequence[Provider[Any]]]] = {}
 
     def get(self, service: type) -> Optional[Provider[Any]]:
-        self.__ensure_existence(service)
-        return last_or_default(self._registry[service])
+        return last_or_default(self._registry.get(service, ()))
 
-    def get_all(self, service: type) -> List[Provider[Any]]:
-        self.__ensure_existence(service)
-        return self._registry[service]
+    def get_all(self, service: type) -> Sequence[Provider[Any]]:
+        return self._registry.get(service, ())
 
     def set(self, service: type, registration: Provider[Any]) -> None:
-        self.__ensure_existence(service)
-        self._registry[service].append(registration)
-
-    def set_all(self, service: type, registrations: List[Provider[Any]]) -> None:
-        self._registry[service] = registrations
+        registrations = self._registry.get(service)
+        if registrations is None:
+            self._registry[service] = [registration]
+        elif isinstance(registrations, list):
+            registrations.append(registration)
+        else:
+            self._registry[service] = [*registrations, registration]
+
+    def set_all(self, service: type, registrations: Sequence[Provider[Any]]) -> None:
+        self._registry[service] = list(registrations)
+
+    def freeze(self, services: Optional[Iterable[type]] = None) -> None:
+        for service in self._registry if services is None else services:
+            if isinstance(registrations := self._registry.get(service), list):
+                self._registry[service] = tuple(registrations)
 
     def has(self, service: type) -> bool:
         return service in self._registry
 
-    def __ensure_existence(self, service: type) -> None:
-        if not self.has(service):
-            self._registry[service] = []
-
     def __del__(self) -> None:
         del self._registry
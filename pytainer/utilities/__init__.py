@@ -1,13 +1,19 @@
+from .dispose_instance import dispose_instance, dispose_instance_async, is_disposable
 from .extract_constructor import extract_constructor
 from .get_generic_bases import get_generic_bases
 from .is_subclass import is_subclass
 from .last_or_default import last_or_default
 from .map_to import map_to
+from .substitute_type_vars import substitute_type_vars
 
 __all__ = [
+    "dispose_instance",
+    "dispose_instance_async",
     "extract_constructor",
     "get_generic_bases",
+    "is_disposable",
     "is_subclass",
     "last_or_default",
     "map_to",
+    "substitute_type_vars",
 ]
@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+from threading import Thread
+from typing import Any, Awaitable, Callable, Optional, cast
+
+
+def is_disposable(instance: object, asynchronous: bool = False) -> bool:
+    if asynchronous and (hasattr(instance, "__aexit__") or callable(getattr(instance, "aclose", None))):
+        return True
+    return _closer(instance) is not None or hasattr(instance, "__exit__")
+
+
+def dispose_instance(instance: object) -> None:
+    # Explicit closers come first, as exiting a context manager that was never entered is an error for many of them.
+    closer = _closer(instance)
+    if closer is None:
+        if hasattr(instance, "__exit__"):
+            instance.__exit__(None, None, None)  # type: ignore
+        return
+
+    if inspect.iscoroutinefunction(closer):
+        raise TypeError(f"{closer.__qualname__} is asynchronous, dispose the container with dispose_async() instead.")
+
+    result = closer()
+    if inspect.isawaitable(result):
+        if inspect.iscoroutine(result):
+            result.close()
+        raise TypeError(f"{closer.__qualname__} returned an awaitable, dispose the container with dispose_async() instead.")
+
+
+async def dispose_instance_async(instance: object) -> None:
+    closer = _closer(instance)
+    if callable(aclose := getattr(instance, "aclose", None)):
+        await cast(Callable[[], Awaitable[Any]], aclose)()
+    elif closer is not None and inspect.iscoroutinefunction(closer):
+        await cast(Callable[[], Awaitable[Any]], closer)()
+    elif closer is None and hasattr(instance, "__aexit__"):
+        await instance.__aexit__(None, None, None)  # type: ignore
+    else:
+        await _run_in_thread(dispose_instance, instance)
+
+
+def _closer(instance: object) -> Optional[Callable[[], Any]]:
+    for name in ("close", "dispose"):
+        if callable(closer := getattr(instance, name, None)):
+            return closer
+    return None
+
+
+def _run_in_thread(function: Callable[[object], None], instance: object) -> "asyncio.Future[None]":
+    # A daemon thread is abandoned when the disposal times out, where the loop's default executor would block its shutdown.
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[None]" = loop.create_future()
+
+    def resolve(exception: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if exception is None:
+            future.set_result(None)
+        else:
+            future.set_exception(exception)
+
+    def run() -> None:
+        exception: Optional[BaseException] = None
+        try:
+            function(instance)
+        except BaseException as ex:
+            exception = ex
+
+        try:
+            loop.call_soon_threadsafe(resolve, exception)
+        except RuntimeError:  # the loop was closed while the closer hung
+            pass
+
+    Thread(target=run, daemon=True).start()
+    return future
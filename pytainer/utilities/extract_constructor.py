@@ -1,12 +1,21 @@
 import inspect
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from pytainer.interfaces import Parameter
-from pytainer.utilities.map_to import map_to
 
 
-def extract_constructor(function: Callable[[Any], Any]) -> List[Parameter[Any]]:
+def extract_constructor(
+    function: Callable[[Any], Any],
+    interned: Optional[Dict[Tuple[Parameter[Any], ...], Tuple[Parameter[Any], ...]]] = None,
+) -> Tuple[Parameter[Any], ...]:
     parameters = inspect.signature(function).parameters
-    filtered_parameters = [parameters[name] for name in parameters if parameters[name].annotation is not inspect.Parameter.empty]
+    dependencies = tuple(Parameter(p.name, p.annotation) for p in parameters.values() if p.annotation is not inspect.Parameter.empty)
 
-    return map_to(filtered_parameters, lambda p: Parameter(p.name, p.annotation))
+    if interned is None:
+        return dependencies
+
+    # Equal signatures share a single dependency tuple, and the parameters in it.
+    try:
+        return interned.setdefault(dependencies, dependencies)
+    except TypeError:  # unhashable annotation
+        return dependencies
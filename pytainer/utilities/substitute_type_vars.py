@@ -0,0 +1,12 @@
+from typing import Any, Dict, TypeVar
+
+
+def substitute_type_vars(_type: Any, mapping: Dict[Any, Any]) -> Any:
+    if isinstance(_type, TypeVar):
+        return mapping.get(_type, _type)
+
+    parameters = getattr(_type, "__parameters__", ())
+    if parameters and hasattr(_type, "__origin__"):
+        return _type[tuple(mapping.get(parameter, parameter) for parameter in parameters)]
+
+    return _type
@@ -1,7 +1,11 @@
+import asyncio
+import time
 import unittest
 from abc import ABC, abstractmethod
+from typing import Generic, List, TypeVar, cast
 
-from pytainer import Container, Lifecycle, RegistrationException, ResolutionException
+from pytainer import Container, Disposal, Lifecycle, RegistrationException, ResolutionException
+from pytainer.exceptions import VerificationException
 
 
 class IService(ABC):
@@ -25,6 +29,109 @@ class Service(IService):
         self._state = state
 
 
+_E = TypeVar("_E")
+
+
+class User:
+    pass
+
+
+class Order:
+    pass
+
+
+class IRepository(Generic[_E]):
+    pass
+
+
+class Repository(IRepository[_E]):
+    def __init__(self, service: IService) -> None:
+        self.service = service
+
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class IMap(Generic[_K, _V]):
+    pass
+
+
+class Map(IMap[_K, _V], Generic[_V, _K]):
+    pass
+
+
+class ListRepository(IRepository[List[_E]]):
+    pass
+
+
+class UserRepository(IRepository[User]):
+    pass
+
+
+class Consumer:
+    def __init__(self, service: IService) -> None:
+        self.service = service
+
+
+class OtherService(IService):
+    def state(self) -> str:
+        return "Other"
+
+    def modify_state(self, state: str) -> None:
+        pass
+
+
+class Connection:
+    closed: List[str] = []
+
+    def close(self) -> None:
+        Connection.closed.append(type(self).__name__)
+
+
+class Client(Connection):
+    def __init__(self, connection: Connection, consumer: Consumer) -> None:
+        self.connection = connection
+
+
+class ClosableRepository(IRepository[_E], Connection):
+    pass
+
+
+class Session(Connection):
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        raise RuntimeError("Session was never entered.")
+
+
+class SlowConnection(Connection):
+    def close(self) -> None:
+        time.sleep(1)
+
+
+class SlowClient(Client):
+    def close(self) -> None:
+        time.sleep(1)
+
+
+class AsyncConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class AsyncClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
 class TestContainer(unittest.TestCase):
     def test_implementation_registration_singleton(self) -> None:
         container = Container()
@@ -140,6 +247,316 @@ class TestContainer(unittest.TestCase):
         instance.modify_state("New State")
         self.assertNotEqual(other_instance.state(), "New State")
 
+    def test_open_generic_registration(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_open_generic(IRepository, Repository)
+        container.verify()
+
+        users = container.resolve(IRepository[User])
+        orders = container.resolve(IRepository[Order])
+
+        self.assertIsInstance(users, Repository)
+        self.assertIsInstance(orders, Repository)
+        self.assertIsNot(users, orders)
+        self.assertIs(users, container.resolve(IRepository[User]))
+        self.assertIs(cast(Repository[User], users).service, container.resolve(IService))
+        self.assertTrue(container.is_registered(IRepository[User]))
+
+    def test_open_generic_closed_registration_precedence(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_open_generic(IRepository, Repository)
+        container.register_implementation(IRepository[User], UserRepository)
+        container.verify()
+
+        self.assertIsInstance(container.resolve(IRepository[User]), UserRepository)
+        self.assertIsInstance(container.resolve(IRepository[Order]), Repository)
+
+    def test_open_generic_reordered_parameters(self) -> None:
+        container = Container()
+        container.register_open_generic(IMap, Map)
+        container.verify()
+
+        instance = container.resolve(IMap[int, str])
+
+        self.assertEqual(Map[str, int], instance.__orig_class__)  # type: ignore
+
+    def test_open_generic_nested_parameters(self) -> None:
+        container = Container()
+        container.register_open_generic(IRepository, ListRepository)
+
+        with self.assertRaises(VerificationException):
+            container.verify()
+
+    def test_open_generic_missing_dependency(self) -> None:
+        container = Container()
+        container.register_open_generic(IRepository, Repository)
+
+        with self.assertRaises(VerificationException):
+            container.verify()
+
+    def test_extension_keeps_unaffected_singletons(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.verify()
+
+        instance = container.resolve(IService)
+
+        with container.extend():
+            container.register_implementation(Consumer, Consumer)
+
+        self.assertTrue(container.verified)
+        self.assertIs(instance, container.resolve(IService))
+        self.assertIs(instance, container.resolve(Consumer).service)
+
+    def test_extension_keeps_container_resolvable(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.verify()
+
+        with container.extend() as extension:
+            extension.register_implementation(IService, OtherService)
+            extension.register_implementation(Consumer, Consumer)
+
+            self.assertTrue(container.verified)
+            self.assertIsInstance(container.resolve(IService), Service)
+            self.assertFalse(container.is_registered(Consumer))
+
+        self.assertIsInstance(container.resolve(IService), OtherService)
+        self.assertIsInstance(container.resolve(Consumer).service, OtherService)
+
+    def test_extension_invalidates_dependent_singletons(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_implementation(Consumer, Consumer)
+        container.verify()
+
+        consumer = container.resolve(Consumer)
+
+        with container.extend():
+            container.register_implementation(IService, OtherService)
+
+        self.assertIsNot(consumer, container.resolve(Consumer))
+        self.assertIsInstance(container.resolve(Consumer).service, OtherService)
+
+    def test_failed_extension_rolls_back(self) -> None:
+        container = Container()
+        container.verify()
+
+        with self.assertRaises(VerificationException):
+            with container.extend():
+                container.register_implementation(Consumer, Consumer)
+
+        self.assertTrue(container.verified)
+        self.assertFalse(container.is_registered(Consumer))
+
+    def test_resolve_all_singleton_aggregate(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_instance(IService, OtherService())
+        container.verify()
+
+        instances = container.resolve_all(IService)
+
+        self.assertEqual(2, len(instances))
+        self.assertIsInstance(instances[0], Service)
+        self.assertIsInstance(instances[1], OtherService)
+        self.assertIs(instances, container.resolve_all(IService))
+
+        with container.extend():
+            container.register_implementation(IService, Service)
+
+        self.assertEqual(3, len(container.resolve_all(IService)))
+
+    def test_resolve_all_transient_aggregate(self) -> None:
+        container = Container()
+        container.register_implementation(IService, Service, Lifecycle.Transient)
+        container.verify()
+
+        self.assertIsInstance(container.resolve_all(IService), list)
+        self.assertIsNot(container.resolve_all(IService)[0], container.resolve_all(IService)[0])
+
+    def test_iter_all_is_lazy(self) -> None:
+        constructed: List[str] = []
+        container = Container()
+        container.register_factory(IService, lambda container: constructed.append("first") or Service())
+        container.register_factory(IService, lambda container: constructed.append("second") or OtherService())
+        container.verify()
+        constructed.clear()
+
+        instances = container.iter_all(IService)
+        self.assertEqual([], constructed)
+
+        self.assertIsInstance(next(instances), Service)
+        self.assertEqual(["first"], constructed)
+
+    def test_iter_all_unregistered(self) -> None:
+        container = Container()
+        container.verify()
+
+        with self.assertRaises(ResolutionException):
+            container.iter_all(IService)
+
+    def test_dispose_in_reverse_dependency_order(self) -> None:
+        Connection.closed = []
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_implementation(Consumer, Consumer, Lifecycle.Transient)
+        container.register_implementation(Connection, Connection)
+        container.register_implementation(Client, Client)
+        container.verify()
+
+        client = container.resolve(Client)
+        disposals = container.dispose()
+
+        self.assertEqual(["Client", "Connection"], Connection.closed)
+        self.assertEqual([Client, Connection], [disposal.service for disposal in disposals])
+        self.assertTrue(all(disposal.succeeded for disposal in disposals))
+        self.assertIsNot(client, container.resolve(Client))
+
+    def test_dispose_retired_singletons(self) -> None:
+        Connection.closed = []
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_implementation(Consumer, Consumer, Lifecycle.Transient)
+        container.register_implementation(Connection, Connection)
+        container.register_implementation(Client, Client)
+        container.verify()
+        container.resolve(Client)
+
+        with container.extend():
+            container.register_implementation(Connection, SlowConnection)
+
+        self.assertEqual([], Connection.closed)
+        disposals = container.dispose()
+
+        self.assertEqual(["Client", "Connection"], Connection.closed)
+        self.assertEqual([Client, Connection], [disposal.service for disposal in disposals])
+
+    def test_dispose_replaced_open_generics(self) -> None:
+        Connection.closed = []
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_open_generic(IRepository, ClosableRepository)
+        container.verify()
+        container.resolve(IRepository[User])
+
+        with container.extend():
+            container.register_open_generic(IRepository, Repository)
+
+        self.assertIsInstance(container.resolve(IRepository[User]), Repository)
+        container.dispose()
+
+        self.assertEqual(["ClosableRepository"], Connection.closed)
+
+    def test_dispose_prefers_close_over_exit(self) -> None:
+        Connection.closed = []
+        container = Container()
+        container.register_implementation(Session, Session)
+        container.verify()
+        container.resolve(Session)
+
+        disposals = container.dispose()
+
+        self.assertTrue(disposals[0].succeeded)
+        self.assertEqual(["Session"], Connection.closed)
+
+    def test_dispose_skips_registered_instances(self) -> None:
+        Connection.closed = []
+        with Container() as container:
+            container.register_instance(Connection, Connection())
+            container.verify()
+            container.resolve(Connection)
+
+        self.assertEqual([], Connection.closed)
+
+    def test_dispose_timeout(self) -> None:
+        container = Container()
+        container.register_implementation(Connection, SlowConnection)
+        container.verify()
+        container.resolve(Connection)
+
+        disposals = container.dispose(timeout=0.05)
+
+        self.assertTrue(disposals[0].timed_out)
+        self.assertFalse(disposals[0].succeeded)
+
+    def test_dispose_timeout_frees_worker(self) -> None:
+        container = Container()
+        container.register_implementation(Connection, SlowConnection)
+        container.register_implementation(Session, Session)
+        container.verify()
+        container.resolve(Connection)
+        container.resolve(Session)
+
+        disposals = container.dispose(timeout=0.05, max_workers=1)
+
+        self.assertTrue(disposals[0].timed_out)
+        self.assertTrue(disposals[1].succeeded)
+
+    def test_dispose_timeout_skips_dependencies(self) -> None:
+        Connection.closed = []
+        container = Container()
+        container.register_implementation(IService, Service)
+        container.register_implementation(Consumer, Consumer)
+        container.register_implementation(Connection, Connection)
+        container.register_implementation(Client, SlowClient)
+        container.verify()
+        connection = container.resolve(Client).connection
+
+        disposals = container.dispose(timeout=0.05)
+
+        self.assertEqual([Client, Connection], [disposal.service for disposal in disposals])
+        self.assertTrue(disposals[0].timed_out)
+        self.assertTrue(disposals[1].skipped)
+        self.assertEqual([], Connection.closed)
+        self.assertIs(connection, container.resolve(Connection))
+
+    def test_dispose_async(self) -> None:
+        async def run() -> AsyncConnection:
+            async with Container() as container:
+                container.register_implementation(AsyncConnection, AsyncConnection)
+                container.verify()
+                return container.resolve(AsyncConnection)
+
+        self.assertTrue(asyncio.run(run()).closed)
+
+    def test_dispose_reports_asynchronous_closers(self) -> None:
+        container = Container()
+        container.register_implementation(AsyncClient, AsyncClient)
+        container.verify()
+        client = container.resolve(AsyncClient)
+
+        disposals = container.dispose()
+
+        self.assertIsInstance(disposals[0].exception, TypeError)
+        self.assertFalse(disposals[0].succeeded)
+        self.assertFalse(client.closed)
+
+    def test_dispose_async_awaits_asynchronous_closers(self) -> None:
+        async def run() -> AsyncClient:
+            async with Container() as container:
+                container.register_implementation(AsyncClient, AsyncClient)
+                container.verify()
+                return container.resolve(AsyncClient)
+
+        self.assertTrue(asyncio.run(run()).closed)
+
+    def test_dispose_async_timeout_does_not_block_the_loop(self) -> None:
+        async def run() -> List[Disposal]:
+            container = Container()
+            container.register_implementation(Connection, SlowConnection)
+            container.verify()
+            container.resolve(Connection)
+            return await container.dispose_async(timeout=0.05)
+
+        start = time.perf_counter()
+        disposals = asyncio.run(run())
+
+        self.assertTrue(disposals[0].timed_out)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
 
 if __name__ == "__main__":
     unittest.main()
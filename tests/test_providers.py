@@ -0,0 +1,58 @@
+import unittest
+from typing import Any, List, Type
+
+from pytainer import Container
+from pytainer.interfaces import Parameter, Provider
+from pytainer.providers import FactoryProvider, ImplementationProvider, InstanceProvider, OpenGenericProvider
+
+
+class Dependency:
+    pass
+
+
+class Service:
+    def __init__(self, dependency: Dependency) -> None:
+        self.dependency = dependency
+
+
+class OtherService:
+    def __init__(self, dependency: Dependency) -> None:
+        self.dependency = dependency
+
+
+def subclasses(cls: Type[Any]) -> List[Type[Any]]:
+    return [cls] + [subclass for child in cls.__subclasses__() for subclass in subclasses(child)]
+
+
+class TestProviders(unittest.TestCase):
+    def test_providers_are_slotted(self) -> None:
+        providers: List[object] = [
+            FactoryProvider(Dependency, lambda container: Dependency()),
+            ImplementationProvider(Service, Service),
+            InstanceProvider(Dependency, Dependency()),
+            OpenGenericProvider(Service, Service),
+            Parameter("dependency", Dependency),
+        ]
+
+        for provider in providers:
+            self.assertFalse(hasattr(provider, "__dict__"), type(provider))
+
+        for cls in subclasses(Provider):
+            self.assertIn("__slots__", cls.__dict__, cls)
+
+    def test_equal_signatures_share_dependencies(self) -> None:
+        container = Container()
+        container.register_instance(Dependency, Dependency())
+        container.register_implementation(Service, Service)
+        container.register_implementation(OtherService, OtherService)
+
+        service = container._registry.get(Service)  # type: ignore
+        other_service = container._registry.get(OtherService)  # type: ignore
+
+        self.assertIsNotNone(service)
+        self.assertIsNotNone(other_service)
+        self.assertIs(service.dependencies, other_service.dependencies)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
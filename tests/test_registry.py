@@ -0,0 +1,45 @@
+import unittest
+
+from pytainer.lifecycle import Lifecycle
+from pytainer.providers import ImplementationProvider
+from pytainer.registry import Registry
+
+
+class Service:
+    pass
+
+
+class TestRegistry(unittest.TestCase):
+    def test_freeze(self) -> None:
+        registry = Registry()
+        first = ImplementationProvider(Service, Service, Lifecycle.Singleton)
+        registry.set(Service, first)
+
+        self.assertIsInstance(registry.get_all(Service), list)
+        registry.freeze()
+        self.assertEqual((first,), registry.get_all(Service))
+
+    def test_set_after_freeze(self) -> None:
+        registry = Registry()
+        first = ImplementationProvider(Service, Service, Lifecycle.Singleton)
+        second = ImplementationProvider(Service, Service, Lifecycle.Singleton)
+        registry.set(Service, first)
+        registry.freeze()
+
+        registry.set(Service, second)
+
+        self.assertEqual([first, second], list(registry.get_all(Service)))
+        self.assertIs(second, registry.get(Service))
+        registry.freeze([Service])
+        self.assertEqual((first, second), registry.get_all(Service))
+
+    def test_lookup_miss_does_not_insert(self) -> None:
+        registry = Registry()
+
+        self.assertEqual((), registry.get_all(Service))
+        self.assertIsNone(registry.get(Service))
+        self.assertFalse(registry.has(Service))
+
+
+if __name__ == "__main__":
+    unittest.main()